@@ -0,0 +1,60 @@
+"""Optional Numba-compiled scoring kernels.
+
+The offline analyzer gathers citation counts, years, and relevance points
+into parallel arrays (struct-of-arrays layout); the kernel below fuses the
+impact bucket lookup, recency decay, and total clamp into one compiled,
+parallel pass over those arrays.
+
+Everything degrades gracefully: when numba isn't installed this module
+still imports and ``compute_scores`` is ``None``, so callers can fall back
+to the NumPy or pure-Python paths.
+"""
+
+from __future__ import annotations
+
+try:
+    import numba
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised when the extra isn't installed
+    numba = None
+
+compute_scores = None
+
+if numba is not None:
+
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _compute_scores(
+        citations, years, relevance, breaks, fracs, impact_max, recency_max, this_year
+    ):
+        n = citations.shape[0]
+        impact = np.empty(n, np.int64)
+        recency = np.empty(n, np.int64)
+        total = np.empty(n, np.int64)
+        for i in numba.prange(n):
+            imp = int(impact_max * fracs[np.searchsorted(breaks, citations[i], side="right")])
+            if imp > impact_max:
+                imp = impact_max
+
+            y = years[i]
+            if y <= 0:
+                rec = 0
+            else:
+                age = this_year - y
+                if age < 0:
+                    age = 0
+                if age >= 10:
+                    rec = 0
+                else:
+                    rec = int(round(recency_max * (1 - age / 10)))
+            if rec > recency_max:
+                rec = recency_max
+
+            t = relevance[i] + imp + rec
+            if t > 100:
+                t = 100
+            impact[i] = imp
+            recency[i] = rec
+            total[i] = t
+        return impact, recency, total
+
+    compute_scores = _compute_scores
@@ -1,36 +1,44 @@
 from __future__ import annotations
 
 import argparse
-import json
+import heapq
 from pathlib import Path
 
-from dotenv import load_dotenv
-
-from research_hunter.clients.semantic_scholar import search_papers
-from research_hunter.offline_analyzer import analyze_corpus
-from research_hunter.scoring import score_paper
+# Heavy dependencies (requests, dotenv, the analyzer) are imported inside the
+# command handlers, so `--help` and `analyze` never pay for the HTTP stack.
 
 
 def _write_outputs(outdir: Path, rows: list[dict]) -> None:
+    from research_hunter.offline_analyzer import write_scored_csv
+
+    try:  # optional accelerator: C-backed JSON serialization
+        import orjson
+    except ImportError:  # pragma: no cover - exercised when the extra isn't installed
+        orjson = None
+
     outdir.mkdir(parents=True, exist_ok=True)
 
-    (outdir / "results.json").write_text(
-        json.dumps(rows, indent=2, ensure_ascii=False) + "\n",
-        encoding="utf-8",
-    )
+    if orjson is not None:
+        # Emits UTF-8 bytes directly; skips the str -> bytes encode step.
+        (outdir / "results.json").write_bytes(
+            orjson.dumps(rows, option=orjson.OPT_INDENT_2) + b"\n"
+        )
+    else:
+        import json
 
-    # lightweight CSV
-    import csv
+        (outdir / "results.json").write_text(
+            json.dumps(rows, indent=2, ensure_ascii=False) + "\n",
+            encoding="utf-8",
+        )
 
     cols = ["score", "year", "citations", "title", "venue", "url", "score_note"]
-    with (outdir / "results.csv").open("w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=cols)
-        w.writeheader()
-        for r in rows:
-            w.writerow({c: r.get(c, "") for c in cols})
+    write_scored_csv(outdir / "results.csv", rows, cols=cols)
 
 
 def cmd_search(args: argparse.Namespace) -> int:
+    from research_hunter.clients.semantic_scholar import search_papers
+    from research_hunter.scoring import score_paper
+
     try:
         papers = search_papers(query=args.query, limit=args.limit)
     except RuntimeError as e:
@@ -53,18 +61,24 @@ def cmd_search(args: argparse.Namespace) -> int:
             }
         )
 
-    rows.sort(key=lambda r: (r.get("score", 0), r.get("year") or 0), reverse=True)
+    top = args.top if args.top is not None else args.limit
+    # nlargest is O(N log k) and returns rows already sorted descending.
+    rows = heapq.nlargest(top, rows, key=lambda r: (r.get("score", 0), r.get("year") or 0))
     _write_outputs(Path(args.outdir), rows)
     print(f"[OK] wrote outputs to: {args.outdir}")
     return 0
 
 
 def cmd_analyze(args: argparse.Namespace) -> int:
+    from research_hunter.offline_analyzer import analyze_corpus
+
     analyze_corpus(
         input_json=Path(args.input),
         out_csv=Path(args.output),
         cfg_path=Path(args.config) if args.config else None,
         this_year=int(args.this_year),
+        top_k=args.top,
+        jobs=int(args.jobs),
     )
     print(f"[OK] wrote scored CSV: {args.output}")
     return 0
@@ -81,6 +95,9 @@ def build_parser() -> argparse.ArgumentParser:
     s.add_argument("--query", required=True)
     s.add_argument("--limit", type=int, default=25)
     s.add_argument("--outdir", default="outputs")
+    s.add_argument(
+        "--top", type=int, default=None, help="Keep only the best N rows (default: --limit)"
+    )
     s.set_defaults(func=cmd_search)
 
     a = sub.add_parser("analyze", help="Offline: score a local JSON corpus and write a CSV")
@@ -88,12 +105,21 @@ def build_parser() -> argparse.ArgumentParser:
     a.add_argument("--output", default="outputs/scored_papers.csv")
     a.add_argument("--config", default=None, help="Optional JSON config path")
     a.add_argument("--this-year", default="2026")
+    a.add_argument("--top", type=int, default=None, help="Keep only the best N rows (default: all)")
+    a.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for scoring (default: 1; small corpora don't repay the fork cost)",
+    )
     a.set_defaults(func=cmd_analyze)
 
     return p
 
 
 def main() -> int:
+    from dotenv import load_dotenv
+
     load_dotenv()
     parser = build_parser()
     args = parser.parse_args()
@@ -42,3 +42,62 @@ def search_papers(
     r.raise_for_status()
     data = r.json()
     return list(data.get("data") or [])
+
+
+def search_papers_many(
+    queries: List[str],
+    limit: int = 25,
+    api_key: Optional[str] = None,
+) -> List[List[Dict[str, Any]]]:
+    """Run several searches concurrently and return one result list per query.
+
+    Uses httpx (optional dependency) so all queries share a single keep-alive
+    connection — HTTP/2 multiplexed when available — instead of paying one
+    TLS handshake per query. Results come back in the same order as
+    ``queries``; blank queries yield empty lists.
+    """
+    qs = [(q or "").strip() for q in queries]
+    if not any(qs):
+        return [[] for _ in qs]
+
+    try:
+        import httpx
+    except ImportError as e:
+        raise RuntimeError(
+            "search_papers_many needs the optional httpx dependency. "
+            "Install it with: pip install 'research-hunter[fast]'"
+        ) from e
+
+    import asyncio
+
+    headers = {}
+    key = api_key or os.getenv("SEMANTIC_SCHOLAR_API_KEY")
+    if key:
+        headers["x-api-key"] = key
+
+    async def _one(client: "httpx.AsyncClient", q: str) -> List[Dict[str, Any]]:
+        if not q:
+            return []
+        params = {
+            "query": q,
+            "limit": int(limit),
+            "fields": "title,year,authors,venue,abstract,url,externalIds,citationCount",
+        }
+        r = await client.get(f"{API_BASE}/paper/search", params=params)
+        if r.status_code == 429:
+            raise RuntimeError(
+                "Semantic Scholar rate limit hit (HTTP 429). "
+                "Set SEMANTIC_SCHOLAR_API_KEY in your .env to increase limits, or retry later."
+            )
+        r.raise_for_status()
+        return list(r.json().get("data") or [])
+
+    async def _run() -> List[List[Dict[str, Any]]]:
+        try:
+            client = httpx.AsyncClient(http2=True, headers=headers, timeout=30)
+        except ImportError:  # the h2 extra isn't installed; plain HTTP/1.1 keep-alive
+            client = httpx.AsyncClient(headers=headers, timeout=30)
+        async with client:
+            return list(await asyncio.gather(*(_one(client, q) for q in qs)))
+
+    return asyncio.run(_run())
@@ -28,16 +28,53 @@ All knobs are configurable via a JSON config file; defaults are safe/generic.
 
 from __future__ import annotations
 
-import csv
+import heapq
 import json
+import multiprocessing
 import re
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set, Tuple
 
+try:  # optional accelerator: vectorized impact/recency over the whole corpus
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised when the extra isn't installed
+    np = None
 
+try:  # optional accelerator: C-backed JSON parsing for large corpora
+    import orjson
+except ImportError:  # pragma: no cover - exercised when the extra isn't installed
+    orjson = None
+
+try:  # optional accelerator: event-driven JSON parsing (O(one paper) peak memory)
+    import ijson
+except ImportError:  # pragma: no cover - exercised when the extra isn't installed
+    ijson = None
+
+try:  # optional accelerator: Rust-backed bulk CSV emission
+    import polars as pl
+except ImportError:  # pragma: no cover - exercised when the extra isn't installed
+    pl = None
+
+# None unless numba is installed; see _kernels.py.
+from research_hunter._kernels import compute_scores as _numba_scores
+
+# Precompiled once; _tokenize runs once per paper and is the hottest string path.
+_RE_WS = re.compile(r"\s+")
+_RE_URL = re.compile(r"https?://\S+")
+_RE_CODE = re.compile(r"```.*?```|`[^`]*`", re.DOTALL)
+# str.translate blanks all punctuation in a single C-level pass.
+_PUNCT_TRANS = str.maketrans({c: " " for c in '/:;()[]{}*_"“”'})
+
+
+@lru_cache(maxsize=8192)
 def _norm(s: str) -> str:
-    return re.sub(r"\s+", " ", (s or "").strip().lower())
+    # Only short, highly repetitive strings (keywords, stopwords, author and
+    # venue names) come through here, so the cache stays small and hot.
+    return _RE_WS.sub(" ", (s or "").strip().lower())
 
 
 def _safe_int(x: Any) -> Optional[int]:
@@ -50,14 +87,10 @@ def _safe_int(x: Any) -> Optional[int]:
 
 
 def _tokenize(text: str) -> str:
-    t = _norm(text)
-    t = re.sub(r"https?://\S+", " ", t)
-    t = re.sub(r"```.*?```", " ", t, flags=re.DOTALL)
-    t = re.sub(r"`[^`]*`", " ", t)
-    t = t.replace("/", " ").replace(":", " ").replace(";", " ")
-    t = re.sub(r"[\(\)\[\]\{\}\*\_\"“”]", " ", t)
-    t = re.sub(r"\s+", " ", t).strip()
-    return t
+    t = _RE_URL.sub(" ", (text or "").lower())
+    t = _RE_CODE.sub(" ", t)
+    t = t.translate(_PUNCT_TRANS)
+    return _RE_WS.sub(" ", t).strip()
 
 
 DEFAULT_CONFIG: Dict[str, Any] = {
@@ -116,7 +149,7 @@ def load_config(path: Optional[Path]) -> Dict[str, Any]:
     return cfg
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PaperScore:
     score: int
     relevance: int
@@ -125,6 +158,36 @@ class PaperScore:
     reason: str
 
 
+@dataclass(frozen=True, slots=True)
+class ScoringParams:
+    """Config knobs extracted once per run instead of re-read per paper."""
+
+    relevance_max: int
+    impact_max: int
+    recency_max: int
+    pph: int
+    max_hits: int
+    stopwords: frozenset
+    norm_keywords: Tuple[str, ...]
+    this_year: int
+
+
+def params_from_config(cfg: Dict[str, Any], this_year: int) -> ScoringParams:
+    w = cfg.get("weights") or {}
+    rel_cfg = cfg.get("relevance") or {}
+    stopwords = frozenset(map(_norm, rel_cfg.get("stopwords") or []))
+    return ScoringParams(
+        relevance_max=int(w.get("relevance_max", 60)),
+        impact_max=int(w.get("impact_max", 20)),
+        recency_max=int(w.get("recency_max", 20)),
+        pph=int(rel_cfg.get("points_per_hit", 6)),
+        max_hits=int(rel_cfg.get("max_unique_hits", 10)),
+        stopwords=stopwords,
+        norm_keywords=tuple(_normalized_keywords(cfg.get("topic_keywords") or [], stopwords)),
+        this_year=this_year,
+    )
+
+
 def _extract_author_names(p: Dict[str, Any]) -> List[str]:
     a = p.get("authors") or []
     out: List[str] = []
@@ -137,23 +200,19 @@ def _extract_author_names(p: Dict[str, Any]) -> List[str]:
     return [_norm(x) for x in out if _norm(x)]
 
 
+def _normalized_keywords(keywords: Sequence[str], stopwords: Set[str]) -> List[str]:
+    """Normalize and stopword-filter keywords once per config, not per paper."""
+    return [k for k in map(_norm, keywords) if k and k not in stopwords]
+
+
 def _relevance_points(
-    text: str,
+    tokenized_text: str,
     keywords: Sequence[str],
-    stopwords: Set[str],
     max_hits: int,
     pph: int,
 ) -> Tuple[int, List[str]]:
-    t = _tokenize(text)
-    hits: List[str] = []
-    for kw in keywords:
-        k = _norm(kw)
-        if not k:
-            continue
-        if k in stopwords:
-            continue
-        if k in t:
-            hits.append(k)
+    """Score already-tokenized text against already-normalized keywords."""
+    hits = [k for k in keywords if k in tokenized_text]
 
     # unique hits only
     uniq = sorted(set(hits))
@@ -162,27 +221,18 @@ def _relevance_points(
     return int(pts), uniq
 
 
+# Citation buckets shared by the scalar and vectorized impact scorers.
+_IMPACT_BREAKS = (1, 10, 20, 50, 100, 200, 500)
+_IMPACT_FRACTIONS = (0.0, 0.1, 0.25, 0.4, 0.55, 0.7, 0.85, 1.0)
+
+
 def _impact_points(citation_count: Optional[int], max_points: int) -> int:
     """Map citation counts to a capped impact score.
 
     Uses a log-ish bucket function so 10 vs 100 citations doesn't dominate.
     """
     c = citation_count or 0
-    if c <= 0:
-        return 0
-    if c >= 500:
-        return max_points
-    if c >= 200:
-        return int(max_points * 0.85)
-    if c >= 100:
-        return int(max_points * 0.7)
-    if c >= 50:
-        return int(max_points * 0.55)
-    if c >= 20:
-        return int(max_points * 0.4)
-    if c >= 10:
-        return int(max_points * 0.25)
-    return int(max_points * 0.1)
+    return int(max_points * _IMPACT_FRACTIONS[bisect_right(_IMPACT_BREAKS, c)])
 
 
 def _recency_points(year: Optional[int], max_points: int, this_year: int) -> int:
@@ -196,54 +246,63 @@ def _recency_points(year: Optional[int], max_points: int, this_year: int) -> int
     return int(round(max_points * (1 - age / 10)))
 
 
-def score_paper(p: Dict[str, Any], cfg: Dict[str, Any], this_year: int) -> PaperScore:
-    w = cfg.get("weights") or {}
-    relevance_max = int(w.get("relevance_max", 60))
-    impact_max = int(w.get("impact_max", 20))
-    recency_max = int(w.get("recency_max", 20))
+def _impact_points_vec(citations: "np.ndarray", max_points: int) -> "np.ndarray":
+    """Vectorized _impact_points: one searchsorted + table lookup per corpus."""
+    idx = np.searchsorted(np.asarray(_IMPACT_BREAKS), citations, side="right")
+    return (max_points * np.asarray(_IMPACT_FRACTIONS)[idx]).astype(int)
 
-    rel_cfg = cfg.get("relevance") or {}
-    pph = int(rel_cfg.get("points_per_hit", 6))
-    max_hits = int(rel_cfg.get("max_unique_hits", 10))
-    stopwords = set(map(_norm, rel_cfg.get("stopwords") or []))
 
-    topic_keywords = list(cfg.get("topic_keywords") or [])
+def _recency_points_vec(years: "np.ndarray", max_points: int, this_year: int) -> "np.ndarray":
+    """Vectorized _recency_points: branchless clip instead of per-paper ifs."""
+    age = np.clip(this_year - years, 0, 10)
+    pts = np.rint(max_points * (1 - age / 10)).astype(int)
+    return np.where(years > 0, pts, 0)
+
 
+def _reason(hits: Sequence[str], citations: Optional[int], year: Optional[int]) -> str:
+    bits = []
+    if hits:
+        bits.append("kw=" + ",".join(hits[:6]))
+    if citations is not None:
+        bits.append(f"citations={citations}")
+    if year:
+        bits.append(f"year={year}")
+    return "; ".join(bits)
+
+
+def score_paper(p: Dict[str, Any], params: ScoringParams) -> PaperScore:
     title = p.get("title") or ""
     abstract = p.get("abstract") or ""
     venue = p.get("venue") or ""
     text = "\n".join([title, abstract, venue])
 
-    relevance_pts, hits = _relevance_points(text, topic_keywords, stopwords, max_hits, pph)
-    relevance_pts = min(relevance_max, relevance_pts)
+    relevance_pts, hits = _relevance_points(
+        _tokenize(text), params.norm_keywords, params.max_hits, params.pph
+    )
+    relevance_pts = min(params.relevance_max, relevance_pts)
 
     citations = _safe_int(p.get("citationCount"))
-    impact_pts = min(impact_max, _impact_points(citations, impact_max))
+    impact_pts = min(params.impact_max, _impact_points(citations, params.impact_max))
 
     year = _safe_int(p.get("year"))
-    recency_pts = min(recency_max, _recency_points(year, recency_max, this_year=this_year))
+    recency_pts = min(
+        params.recency_max, _recency_points(year, params.recency_max, this_year=params.this_year)
+    )
 
     total = int(min(100, relevance_pts + impact_pts + recency_pts))
 
-    reason_bits = []
-    if hits:
-        reason_bits.append("kw=" + ",".join(hits[:6]))
-    if citations is not None:
-        reason_bits.append(f"citations={citations}")
-    if year:
-        reason_bits.append(f"year={year}")
-
     return PaperScore(
         score=total,
         relevance=relevance_pts,
         impact=impact_pts,
         recency=recency_pts,
-        reason="; ".join(reason_bits),
+        reason=_reason(hits, citations, year),
     )
 
 
 def load_papers(path: Path) -> List[Dict[str, Any]]:
-    data = json.loads(path.read_text(encoding="utf-8"))
+    raw = path.read_bytes()
+    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
     if isinstance(data, dict) and "data" in data:
         data = data["data"]
     if not isinstance(data, list):
@@ -251,25 +310,139 @@ def load_papers(path: Path) -> List[Dict[str, Any]]:
     return [x for x in data if isinstance(x, dict)]
 
 
-def write_scored_csv(out_path: Path, rows: List[Dict[str, Any]]) -> None:
+def _iter_data_items(f: Any) -> Iterator[Dict[str, Any]]:
+    """Stream the items of a ``{"data": [...]}`` document, validating its shape.
+
+    Tracks whether a top-level "data" array was actually entered, so a dict
+    root without one (or with a non-list "data") raises the same ValueError
+    as the buffered loader instead of looking like an empty corpus.
+    """
+    found_data = False
+    builder = None
+    for prefix, event, value in ijson.parse(f):
+        if builder is not None:
+            builder.event(event, value)
+            if prefix == "data.item" and event == "end_map":
+                yield builder.value
+                builder = None
+        elif prefix == "data" and event == "start_array":
+            found_data = True
+        elif prefix == "data.item" and event == "start_map":
+            builder = ijson.ObjectBuilder()
+            builder.event(event, value)
+    if not found_data:
+        raise ValueError("Input JSON must be a list[dict] (or a dict with key 'data').")
+
+
+def iter_papers(path: Path) -> Iterator[Dict[str, Any]]:
+    """Yield paper dicts one at a time.
+
+    With ijson installed the corpus is parsed incrementally, so peak memory
+    stays at one paper instead of the whole document tree. Without it this
+    falls back to the buffered load_papers.
+    """
+    if ijson is None:
+        yield from load_papers(path)
+        return
+
+    with path.open("rb") as f:
+        # Peek the first non-whitespace byte to find the container shape.
+        ch = f.read(1)
+        while ch.isspace():
+            ch = f.read(1)
+        f.seek(0)
+        try:
+            if ch == b"[":
+                for item in ijson.items(f, "item"):
+                    if isinstance(item, dict):
+                        yield item
+            elif ch == b"{":
+                yield from _iter_data_items(f)
+            else:
+                raise ValueError("Input JSON must be a list[dict] (or a dict with key 'data').")
+        except ijson.JSONError as e:
+            # Match the buffered loader, which raises json.JSONDecodeError
+            # (a ValueError) for malformed input.
+            raise ValueError(f"Invalid JSON in corpus file: {e}") from e
+
+
+_CSV_COLS = [
+    "score",
+    "relevance",
+    "impact",
+    "recency",
+    "year",
+    "citationCount",
+    "title",
+    "venue",
+    "url",
+    "reason",
+]
+
+
+def _csv_field(v: Any) -> str:
+    """Quote a field only when it needs it (same output as QUOTE_MINIMAL)."""
+    s = "" if v is None else str(v)
+    if any(c in s for c in ',"\n\r'):
+        s = '"' + s.replace('"', '""') + '"'
+    return s
+
+
+def write_scored_csv(
+    out_path: Path, rows: List[Dict[str, Any]], cols: Optional[Sequence[str]] = None
+) -> None:
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    cols = [
-        "score",
-        "relevance",
-        "impact",
-        "recency",
-        "year",
-        "citationCount",
-        "title",
-        "venue",
-        "url",
-        "reason",
-    ]
-    with out_path.open("w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=cols)
-        w.writeheader()
+    cols = list(cols) if cols is not None else _CSV_COLS
+
+    if pl is not None:
+        # Column-oriented Utf8 frame; the CSV bytes are produced in Rust.
+        # \r\n keeps line endings byte-stable with the manual writer below;
+        # quoting can still differ benignly (polars quotes empty fields).
+        data: Dict[str, List[str]] = {c: [] for c in cols}
         for r in rows:
-            w.writerow({c: r.get(c, "") for c in cols})
+            for c in cols:
+                v = r.get(c, "")
+                data[c].append("" if v is None else str(v))
+        pl.DataFrame(data).write_csv(out_path, line_terminator="\r\n")
+        return
+
+    # Assemble everything in memory and write once: no per-row DictWriter
+    # dispatch, one write() instead of one per row.
+    lines = [",".join(cols) + "\r\n"]
+    lines.extend(",".join(_csv_field(r.get(c, "")) for c in cols) + "\r\n" for r in rows)
+    out_path.write_text("".join(lines), encoding="utf-8", newline="")
+
+
+def _make_row(p: Dict[str, Any], sc: PaperScore) -> Dict[str, Any]:
+    return {
+        "score": sc.score,
+        "relevance": sc.relevance,
+        "impact": sc.impact,
+        "recency": sc.recency,
+        "year": p.get("year") or "",
+        "citationCount": p.get("citationCount") or "",
+        "title": p.get("title") or "",
+        "venue": p.get("venue") or "",
+        "url": p.get("url") or p.get("doi") or "",
+        "reason": sc.reason,
+    }
+
+
+def _row_key(r: Dict[str, Any]) -> Tuple[int, int]:
+    return (r.get("score", 0), r.get("year") or 0)
+
+
+def _iter_scored_rows(
+    papers: Iterator[Dict[str, Any]], params: ScoringParams
+) -> Iterator[Dict[str, Any]]:
+    """Score papers one at a time, yielding finished output rows."""
+    for p in papers:
+        yield _make_row(p, score_paper(p, params))
+
+
+def _score_chunk(papers: List[Dict[str, Any]], params: ScoringParams) -> List[Dict[str, Any]]:
+    """Score one chunk of papers; top-level so worker processes can pickle it."""
+    return list(_iter_scored_rows(iter(papers), params))
 
 
 def analyze_corpus(
@@ -277,27 +450,106 @@ def analyze_corpus(
     out_csv: Path,
     cfg_path: Optional[Path] = None,
     this_year: int = 2026,
+    top_k: Optional[int] = None,
+    jobs: int = 1,
 ) -> None:
     cfg = load_config(cfg_path)
-    papers = load_papers(input_json)
-
+    params = params_from_config(cfg, this_year)
+    papers = iter_papers(input_json)
+
+    if jobs and jobs > 1:
+        # Scoring is embarrassingly parallel across papers. This trades the
+        # streaming-memory win for cores: the corpus is materialized so it
+        # can be chunked across worker processes. Chunks are contiguous so
+        # concatenating them preserves input order and the stable sort below
+        # breaks ties exactly like the serial path.
+        plist = list(papers)
+        size = -(-len(plist) // jobs)  # ceil division
+        chunks = [plist[i * size : (i + 1) * size] for i in range(jobs)]
+        # Spawned (not forked) workers: numba's parallel threading layer is
+        # not fork-safe, and forking after the scoring kernel has run once
+        # hangs the interpreter at shutdown.
+        ctx = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=jobs, mp_context=ctx) as ex:
+            scored = [r for sub in ex.map(_score_chunk, chunks, [params] * jobs) for r in sub]
+        if top_k is not None:
+            scored = heapq.nlargest(top_k, scored, key=_row_key)
+        else:
+            scored.sort(key=_row_key, reverse=True)
+        write_scored_csv(out_csv, scored)
+        return
+
+    if top_k is not None:
+        # Fused pass: score straight off the stream and keep only the best
+        # top_k rows in a bounded heap (O(N log k), O(k) memory).
+        top = heapq.nlargest(top_k, _iter_scored_rows(papers, params), key=_row_key)
+        write_scored_csv(out_csv, top)
+        return
+
+    # Stream papers: only the (small) output rows and scalar columns are kept;
+    # the raw dicts are dropped as soon as relevance is scored.
     scored: List[Dict[str, Any]] = []
+    hit_lists: List[List[str]] = []
+    citations: List[Optional[int]] = []
+    years: List[Optional[int]] = []
     for p in papers:
-        sc = score_paper(p, cfg, this_year=this_year)
-        scored.append(
-            {
-                "score": sc.score,
-                "relevance": sc.relevance,
-                "impact": sc.impact,
-                "recency": sc.recency,
-                "year": p.get("year") or "",
-                "citationCount": p.get("citationCount") or "",
-                "title": p.get("title") or "",
-                "venue": p.get("venue") or "",
-                "url": p.get("url") or p.get("doi") or "",
-                "reason": sc.reason,
-            }
-        )
+        title = p.get("title") or ""
+        abstract = p.get("abstract") or ""
+        venue = p.get("venue") or ""
+        text = "\n".join([title, abstract, venue])
 
-    scored.sort(key=lambda r: (r.get("score", 0), r.get("year") or 0), reverse=True)
+        relevance, hits = _relevance_points(
+            _tokenize(text), params.norm_keywords, params.max_hits, params.pph
+        )
+        relevance = min(params.relevance_max, relevance)
+
+        citations.append(_safe_int(p.get("citationCount")))
+        years.append(_safe_int(p.get("year")))
+        hit_lists.append(hits)
+        scored.append(_make_row(p, PaperScore(0, relevance, 0, 0, "")))
+
+    totals: Optional[List[int]] = None
+    if np is not None:
+        # Whole-corpus arrays: vector ops instead of ~7 branches per paper.
+        cites_arr = np.array([c or 0 for c in citations], dtype=np.int64)
+        years_arr = np.array([y or 0 for y in years], dtype=np.int64)
+        if _numba_scores is not None:
+            # Fused compiled kernel over the struct-of-arrays layout.
+            rel_arr = np.array([r["relevance"] for r in scored], dtype=np.int64)
+            impact_arr, recency_arr, total_arr = _numba_scores(
+                cites_arr,
+                years_arr,
+                rel_arr,
+                np.asarray(_IMPACT_BREAKS, dtype=np.int64),
+                np.asarray(_IMPACT_FRACTIONS),
+                params.impact_max,
+                params.recency_max,
+                params.this_year,
+            )
+            impact_pts = impact_arr.tolist()
+            recency_pts = recency_arr.tolist()
+            totals = total_arr.tolist()
+        else:
+            impact_pts = _impact_points_vec(cites_arr, params.impact_max).tolist()
+            recency_pts = _recency_points_vec(
+                years_arr, params.recency_max, params.this_year
+            ).tolist()
+    else:
+        impact_pts = [_impact_points(c, params.impact_max) for c in citations]
+        recency_pts = [_recency_points(y, params.recency_max, params.this_year) for y in years]
+
+    for i, (row, hits, cit, yr, impact, recency) in enumerate(
+        zip(scored, hit_lists, citations, years, impact_pts, recency_pts)
+    ):
+        impact = min(params.impact_max, int(impact))
+        recency = min(params.recency_max, int(recency))
+        row["impact"] = impact
+        row["recency"] = recency
+        if totals is not None:
+            row["score"] = int(totals[i])
+        else:
+            row["score"] = int(min(100, row["relevance"] + impact + recency))
+        row["reason"] = _reason(hits, cit, yr)
+
+    scored.sort(key=_row_key, reverse=True)
     write_scored_csv(out_csv, scored)
@@ -1,8 +1,15 @@
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
 from datetime import date
-from typing import Any, Dict, List, Tuple
+from functools import lru_cache
+from typing import Any, Dict, List, Pattern, Tuple
+
+try:  # optional accelerator: single-pass multi-pattern matching
+    import ahocorasick
+except ImportError:  # pragma: no cover - exercised when the extra isn't installed
+    ahocorasick = None
 
 
 @dataclass(frozen=True)
@@ -33,6 +40,88 @@ DEFAULT_KEYWORDS: Dict[str, int] = {
 }
 
 
+def _compile_keywords(keywords: Tuple[str, ...]) -> Tuple[Pattern[str], Dict[str, Tuple[str, ...]]]:
+    """Compile one alternation over all keywords plus a containment map.
+
+    A single pass of the C regex engine replaces one substring search per
+    keyword. Regex matching is non-overlapping, so two fixups keep the
+    semantics identical to per-keyword ``in``: the longest alternative is
+    listed first (ties at the same start match the longest keyword), and the
+    map records which shorter keywords are substrings of a longer one — if
+    the longer matched, the shorter necessarily occurs too.
+    """
+    ordered = sorted(keywords, key=len, reverse=True)
+    pattern = re.compile("|".join(re.escape(k) for k in ordered))
+    implies = {k: tuple(s for s in keywords if s != k and s in k) for k in keywords}
+    return pattern, implies
+
+
+@lru_cache(maxsize=32)
+def _pattern_for(keywords: Tuple[str, ...]) -> Tuple[Pattern[str], Dict[str, Tuple[str, ...]]]:
+    """Cache compiled alternations for caller-supplied keyword sets."""
+    return _compile_keywords(keywords)
+
+
+def _find_keywords(t: str, pattern: Pattern[str], implies: Dict[str, Tuple[str, ...]]) -> set:
+    """Return every keyword occurring in t using one scan of the alternation."""
+    found: set = set()
+    pos = 0
+    while True:
+        m = pattern.search(t, pos)
+        if m is None:
+            break
+        found.add(m.group())
+        # Resume just past the match *start* so overlapping keywords that
+        # begin inside this match are still seen.
+        pos = m.start() + 1
+    for k in tuple(found):
+        found.update(implies[k])
+    return found
+
+
+def _build_scorer(keywords: Dict[str, int], binary: bool = False) -> Any:
+    """Generate an unrolled scorer specialized to a fixed keyword set.
+
+    Emits one constant-string ``in`` check per keyword and compiles it once
+    with exec, so the hot path carries no dict iteration, weight casts, or
+    loop bookkeeping. With ``binary=True`` the probes are bytes constants for
+    scanning ASCII-encoded text (reported hits stay str either way).
+    """
+    lines = ["def _scorer(t):", "    total = 0", "    hits = []"]
+    for kw, w in keywords.items():
+        kw, w = kw.lower(), int(w)
+        probe = kw.encode("ascii", "ignore") if binary else kw
+        lines.append(f"    if {probe!r} in t:")
+        lines.append(f"        total += {w}")
+        lines.append(f"        hits.append(({kw!r}, {w}))")
+    lines.append("    return total, hits")
+    ns: Dict[str, Any] = {}
+    exec("\n".join(lines), ns)
+    return ns["_scorer"]
+
+
+_DEFAULT_SCORER = _build_scorer(DEFAULT_KEYWORDS)
+_DEFAULT_SCORER_ASCII = _build_scorer(DEFAULT_KEYWORDS, binary=True)
+
+
+def _build_automaton(keywords: Dict[str, int]) -> Any:
+    """Build an Aho-Corasick automaton mapping each keyword to (keyword, weight)."""
+    automaton = ahocorasick.Automaton()
+    for kw, w in keywords.items():
+        automaton.add_word(kw, (kw, int(w)))
+    automaton.make_automaton()
+    return automaton
+
+
+_DEFAULT_AUTOMATON = _build_automaton(DEFAULT_KEYWORDS) if ahocorasick is not None else None
+
+
+@lru_cache(maxsize=32)
+def _automaton_for(items: Tuple[Tuple[str, int], ...]) -> Any:
+    """Cache automatons for caller-supplied keyword sets."""
+    return _build_automaton(dict(items))
+
+
 def _impact_points(citations: int) -> int:
     """0..20 impact points from citation count (bucketed, capped)."""
     c = max(0, int(citations or 0))
@@ -75,10 +164,31 @@ def score_text(text: str, keywords: Dict[str, int] | None = None) -> Tuple[int,
 
     hits: List[Tuple[str, int]] = []
     total = 0
-    for kw, w in kws.items():
-        if kw in t:
-            total += int(w)
-            hits.append((kw, int(w)))
+    if ahocorasick is not None:
+        if keywords is None:
+            automaton = _DEFAULT_AUTOMATON
+        else:
+            automaton = _automaton_for(tuple(sorted(kws.items())))
+        # One linear pass over the text instead of one scan per keyword.
+        seen: Dict[str, int] = {}
+        for _, (kw, w) in automaton.iter(t):
+            seen[kw] = w
+        total = sum(seen.values())
+        hits = list(seen.items())
+    elif keywords is None:
+        # Specialized functions generated at import time for the default set.
+        try:
+            # Scientific text is almost always ASCII; searching bytes skips
+            # CPython's unicode-kind dispatch in the substring scan.
+            total, hits = _DEFAULT_SCORER_ASCII(t.encode("ascii"))
+        except UnicodeEncodeError:
+            total, hits = _DEFAULT_SCORER(t)
+    else:
+        pattern, implies = _pattern_for(tuple(sorted(kws)))
+        for kw in _find_keywords(t, pattern, implies):
+            w = int(kws[kw])
+            total += w
+            hits.append((kw, w))
 
     # Normalize to 0..60 by capping and scaling
     total = max(0, min(60, total))
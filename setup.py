@@ -0,0 +1,25 @@
+"""Optional native build hook.
+
+``pip install .`` stays pure Python. When Cython 3 happens to be installed,
+the scoring module is additionally compiled to a C extension straight from
+its .py source (pure-Python mode, no separate .pyx to keep in sync); the
+built extension shadows the .py at import time, giving native-speed integer
+math and string ops with zero behavior change.
+
+Set RESEARCH_HUNTER_PURE=1 to skip compilation even when Cython is present.
+"""
+
+import os
+
+from setuptools import setup
+
+ext_modules = []
+if not os.environ.get("RESEARCH_HUNTER_PURE"):
+    try:
+        from Cython.Build import cythonize
+
+        ext_modules = cythonize(["research_hunter/scoring.py"], language_level=3)
+    except ImportError:
+        pass
+
+setup(ext_modules=ext_modules)